@@ -5,32 +5,83 @@ Displays temperatures and fan speeds, with optional automatic control
 """
 
 import os
+import re
 import sys
 import time
+import atexit
 import argparse
-import select
-import termios
-import tty
+import selectors
 import shutil
-import subprocess
+import signal
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_right
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
-from collections import deque
+
+
+# sysfs reports temperatures in millidegrees Celsius
+MILLIDEGREES_PER_DEGREE = 1000.0
+# Temperature readings outside this range (°C) come from absent or broken sensors
+TEMP_VALID_MIN = 0.0
+TEMP_VALID_MAX = 120.0
+
+# SGR color sequences, stripped when measuring on-screen text width
+ANSI_ESCAPE = re.compile(r"\033\[[0-9;]*m")
+
+# Duty cycle percentage for every possible PWM value (0-255)
+PWM_PERCENT = tuple(value / 255.0 * 100 for value in range(256))
+
+# Bytes written to a pwmN file for every possible PWM value (0-255)
+PWM_BYTES = tuple(str(value).encode() for value in range(256))
+
+# Settings used when the config file is missing or leaves a key out. This
+# is the one list of config keys; parsing and saving are derived from it.
+_DEFAULT_CONFIG = MappingProxyType({
+    'interval': 2.0,
+    'temp_min': 45.0,
+    'temp_max': 80.0,
+    'pwm_min': 10,
+    'pwm_max': 255,
+    'pwm_decrease_step': 5,
+    'history_size': 300,
+    'hwmon_path': '/sys/class/hwmon/hwmon3',
+})
+
+# Config file keys and the type each value is converted to
+_CONFIG_PARSERS = {key: type(value) for key, value in _DEFAULT_CONFIG.items()}
 
 
 class KeyboardHandler:
     """Handle non-blocking keyboard input"""
 
+    # Escape sequences sent by the arrow keys
+    ESCAPE_SEQUENCES = {
+        b'\x1b[A': 'UP',
+        b'\x1b[B': 'DOWN',
+        b'\x1b[C': 'RIGHT',
+        b'\x1b[D': 'LEFT',
+    }
+
     def __init__(self):
         self.old_settings = None
         self.enabled = True
+        self.pending = b''  # Bytes read from stdin but not yet returned as keys
+        self.selector = None  # epoll/poll selector watching stdin while enabled
 
     def __enter__(self):
         """Set terminal to raw mode for non-blocking input"""
         try:
             if sys.stdin.isatty():
+                # Terminal modules are only needed for interactive use
+                import termios
+                import tty
                 self.old_settings = termios.tcgetattr(sys.stdin)
                 tty.setcbreak(sys.stdin.fileno())
+                self.selector = selectors.DefaultSelector()
+                self.selector.register(sys.stdin, selectors.EVENT_READ)
             else:
                 self.enabled = False
         except:
@@ -39,42 +90,173 @@ class KeyboardHandler:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Restore terminal settings"""
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
         if self.old_settings:
+            import termios
             try:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
             except:
                 pass
 
     def get_key(self, timeout: float = 0.0) -> Optional[str]:
-        """Get a key press without blocking. Returns None if no key pressed."""
+        """Get a key press, waiting up to timeout seconds. Returns None if no key pressed."""
         if not self.enabled:
+            # Nothing to wait on; still honour the timeout so callers don't spin
+            if timeout > 0:
+                time.sleep(timeout)
             return None
-        if select.select([sys.stdin], [], [], timeout)[0]:
-            ch = sys.stdin.read(1)
-            # Handle escape sequences (arrow keys)
-            if ch == '\x1b':
-                # Give a bit more time for the rest of the escape sequence
-                if select.select([sys.stdin], [], [], 0.1)[0]:
-                    ch2 = sys.stdin.read(1)
-                    if ch2 == '[':
-                        if select.select([sys.stdin], [], [], 0.1)[0]:
-                            ch3 = sys.stdin.read(1)
-                            if ch3 == 'A':
-                                return 'UP'
-                            elif ch3 == 'B':
-                                return 'DOWN'
-                            elif ch3 == 'C':
-                                return 'RIGHT'
-                            elif ch3 == 'D':
-                                return 'LEFT'
+        if not self.pending:
+            if not self.selector.select(timeout):
+                return None
+            # A single read picks up a whole escape sequence at once
+            # (stdin is ready, so this doesn't block in cbreak mode)
+            self.pending = os.read(sys.stdin.fileno(), 8)
+            if not self.pending:
+                return None
+
+        data = self.pending
+        # Handle escape sequences (arrow keys)
+        if data[:1] == b'\x1b':
+            if data[1:2] != b'[':
+                self.pending = data[1:]
                 return 'ESC'  # Just ESC key pressed
-            return ch
-        return None
+            self.pending = data[3:]
+            return self.ESCAPE_SEQUENCES.get(data[:3], 'ESC')
+
+        self.pending = data[1:]
+        return data[:1].decode(errors='ignore')
+
+
+class HistoryBuffer:
+    """Fixed-size ring buffer of float samples in a preallocated array
+
+    Samples are stored as 32-bit floats, which is ample precision for
+    temperatures and fan speeds. Storage is rounded up to a power of two
+    so slot indices are a bit mask of a running sample counter instead of
+    a modulo.
+    """
+
+    def __init__(self, maxlen: int):
+        self.maxlen = max(1, maxlen)
+        capacity = 1 << (self.maxlen - 1).bit_length()
+        self.mask = capacity - 1
+        self.data = array('f', [0.0]) * capacity
+        self.total = 0  # Number of samples ever appended
+        self.count = 0  # Number of valid samples (up to maxlen)
+        # Running extremes; None means stale and recomputed on demand
+        self._min = None
+        self._max = None
+
+    def append(self, value: float):
+        """Add a sample, dropping the oldest one when full"""
+        if self.count == self.maxlen:
+            # Evicting the current extreme invalidates it
+            evicted = self.data[(self.total - self.maxlen) & self.mask]
+            if evicted == self._min:
+                self._min = None
+            if evicted == self._max:
+                self._max = None
+        else:
+            self.count += 1
+        slot = self.total & self.mask
+        self.data[slot] = value
+        value = self.data[slot]  # As stored, so extremes compare equal on eviction
+        self.total += 1
+
+        if self._min is not None and value < self._min:
+            self._min = value
+        if self._max is not None and value > self._max:
+            self._max = value
+        if self.count == 1:
+            self._min = self._max = value
+
+    def _window(self, n: int) -> Tuple[array, ...]:
+        """Return the most recent n samples as one or two array slices"""
+        n = max(0, min(n, self.count))
+        start = (self.total - n) & self.mask
+        end = start + n
+        if end <= len(self.data):
+            return (self.data[start:end],)
+        # Window wraps around the end of the array
+        return (self.data[start:], self.data[:end & self.mask])
+
+    def recent(self, n: int) -> List[float]:
+        """Return the most recent n samples, oldest first"""
+        samples = []
+        for part in self._window(n):
+            samples.extend(part)
+        return samples
+
+    def bounds(self) -> Tuple[float, float]:
+        """Return (min, max) over all valid samples
+
+        Extremes are maintained as samples are appended; a full scan only
+        happens after the sample holding the current min or max is evicted.
+        """
+        if self._min is None or self._max is None:
+            parts = [part for part in self._window(self.count) if part]
+            if not parts:
+                raise ValueError("bounds() of empty HistoryBuffer")
+            self._min = min(min(part) for part in parts)
+            self._max = max(max(part) for part in parts)
+        return self._min, self._max
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        return iter(self.recent(self.count))
 
 
 class FanController:
     """Controls and monitors system fans and temperatures"""
 
+    # Move cursor home and clear the screen
+    CLEAR_SCREEN = "\033[H\033[J"
+
+    # Manual PWM offset change for each key in auto control
+    OFFSET_KEYS = {
+        'w': 10, 'W': 10, 'UP': 10,
+        's': -10, 'S': -10, 'DOWN': -10,
+    }
+
+    # Max temperature change (°C) between polls still treated as stable
+    STABLE_TEMP_DELTA = 0.5
+
+    # Temperature change (°C) between polls that switches to fast polling
+    FAST_TEMP_DELTA = 3.0
+
+    # Auto control steps fan speed down in bands of PWM_BAND units, only
+    # after BAND_HOLD_SECONDS in a band and a BAND_DROP_MARGIN (°C) cool-down
+    PWM_BAND = 16
+    BAND_HOLD_SECONDS = 10
+    BAND_DROP_MARGIN = 2.0
+
+    # PWM changes smaller than this are held back in auto control
+    PWM_DEAD_BAND = 2
+
+    # Restarts of an nvidia-smi monitor that exits without reporting a
+    # temperature before falling back to one-shot queries for good
+    GPU_MONITOR_MAX_RESTARTS = 3
+
+    # Display names for pwmN_enable values
+    PWM_ENABLE_NAMES = {
+        "0": "off/full",
+        "1": "manual",
+        "2": "auto",
+        "3": "auto",
+        "4": "auto",
+        "5": "auto"
+    }
+
+    # Prebuilt bar and rule strings; display code slices these instead of
+    # repeating characters each frame (widths are capped at 140 columns)
+    _FULL_BAR = "█" * 512
+    _EMPTY_BAR = "░" * 512
+    _HR = "─" * 512
+
     def __init__(self, hwmon_path: str = "/sys/class/hwmon/hwmon3", history_size: int = 300):
         self.hwmon_path = Path(hwmon_path)
 
@@ -87,8 +269,17 @@ class FanController:
         # History tracking
         # Large enough to handle ultra-wide terminals (graph width auto-scales)
         self.history_size = history_size
-        self.temp_history = deque(maxlen=history_size)
-        self.fan_history = deque(maxlen=history_size)
+        self.temp_history = HistoryBuffer(history_size)
+        self.fan_history = HistoryBuffer(history_size)
+
+        # Inputs of the last frame drawn, used to skip identical redraws
+        self._last_render_key = None
+        # Lines of the frame on screen (drawn from the top-left corner), used
+        # to redraw only the lines that change; None forces a full redraw
+        self._screen_lines = None
+        # Cached display layout and the (width, sensor names) it was built for
+        self._layout_key = None
+        self._layout = None
 
         # Manual control
         self.manual_pwm_offset = 0  # Offset from auto value for manual adjustment
@@ -101,8 +292,20 @@ class FanController:
         try:
             terminal_size = shutil.get_terminal_size(fallback=(140, 40))
             self.term_width = terminal_size.columns
+            self.term_height = terminal_size.lines
         except:
             self.term_width = 140  # Default fallback
+            self.term_height = 40
+        # Bumped on every resize so a frame drawn across one isn't remembered
+        self._resize_count = 0
+
+        # Track terminal resizes so graphs re-flow without querying the
+        # terminal size on every redraw. term_width is replaced with a single
+        # attribute assignment, so the display loop always sees a whole value.
+        try:
+            signal.signal(signal.SIGWINCH, self._on_terminal_resize)
+        except (AttributeError, ValueError, OSError):
+            pass  # No SIGWINCH on this platform, or not in the main thread
 
         # ANSI color codes
         self.COLOR_GREEN = '\033[92m'
@@ -110,29 +313,166 @@ class FanController:
         self.COLOR_RED = '\033[91m'
         self.COLOR_CYAN = '\033[96m'
         self.COLOR_RESET = '\033[0m'
+        # Invisible escape-code length added around highlighted sensor names
+        self._HIGHLIGHT_EXTRA = len(self.COLOR_CYAN) + len(self.COLOR_RESET)
+
+        # Color lookup tables indexed by whole degrees (0-120°C) and whole
+        # percent (0-100%), so picking a color is one list index
+        self._temp_colors = [
+            self.COLOR_GREEN if temp < 50 else self.COLOR_YELLOW if temp < 70 else self.COLOR_RED
+            for temp in range(121)
+        ]
+        self._percent_colors = [
+            self.COLOR_GREEN if percent < 40 else self.COLOR_YELLOW if percent < 70 else self.COLOR_RED
+            for percent in range(101)
+        ]
+
+        # Pre-rendered history graph cells per color: (full block, half block)
+        self._cell_cache = {
+            color: (color + '█' + self.COLOR_RESET, color + '▄' + self.COLOR_RESET)
+            for color in (self.COLOR_GREEN, self.COLOR_YELLOW, self.COLOR_RED)
+        }
+        # Graph columns (top to bottom) keyed by (cells, full rows, half rows, height)
+        self._column_cache = {}
+        # Graph row thresholds keyed by (max value, height)
+        self._threshold_cache = {}
+        # Horizontal bars keyed by (color, filled, width); reset on layout changes
+        self._bar_cache = {}
 
         # Auto-detect sensors, fans, and PWM controls
         self.temp_sensors = []  # List of (path, label) tuples
         self.fan_sensors = []   # List of (path, label) tuples
         self.pwm_controls = []  # List of (path, enable_path, label) tuples
+        self.pwm_fans = {}      # PWM path -> (fan path, fan label) it drives
+        self._fd_cache = {}     # Path -> persistent read-only fd for sysfs files
+        self._pwm_fds = {}      # Path -> write-only fd for PWM values, while under auto control
+        self._last_pwm = {}     # pwm Path -> value last written through set_all_pwm_values
+        self._pwm_state_cache = {}  # pwm Path -> (mode, enable) display strings
+        self._nvml = None       # pynvml module, if NVML is used for the GPU
+        self._nvml_handle = None
+        self._gpu_monitor = None  # Long-running nvidia-smi process, if NVML is unavailable
+        self._gpu_temp = None     # Latest GPU temperature reported by _gpu_monitor
+        self._gpu_monitor_restarts = 0  # Restarts since the monitor last reported a value
+        # Readings younger than sensor_ttl seconds are reused (0 disables)
+        self.sensor_ttl = 0.0
+        self._reading_cache = {}  # Reading kind -> (monotonic timestamp, readings)
         self._detect_hardware()
+        # Sensors are detected once, so the set of control sensors is fixed
+        self._control_sensor_set = frozenset(self.get_control_sensor_names())
+        self._control_sensors = [(sensor_path, label) for sensor_path, label, _ in self.temp_sensors
+                                 if label in self._control_sensor_set]
+
+    def _on_terminal_resize(self, signum, frame):
+        """SIGWINCH handler: refresh the cached terminal size"""
+        try:
+            terminal_size = shutil.get_terminal_size(fallback=(140, 40))
+            self.term_width = terminal_size.columns
+            self.term_height = terminal_size.lines
+        except:
+            pass  # Keep the previous size
+        # The terminal may have reflowed the old frame, so always redraw
+        self._resize_count += 1
+        self._last_render_key = None
+        self._screen_lines = None
 
     def read_file(self, path: Path) -> str:
         """Read a sysfs file and return its contents"""
+        buf = self._read_raw(path)
+        return None if buf is None else buf.strip().decode()
+
+    def read_int(self, path: Path) -> Optional[int]:
+        """Read an integer sysfs value, returns None if unavailable or invalid"""
+        buf = self._read_raw(path)
+        try:
+            # int() parses ASCII digits straight from bytes and ignores the
+            # trailing newline, so no decode/strip is needed
+            return int(buf)
+        except (ValueError, TypeError):
+            return None
+
+    def _read_raw(self, path: Path) -> Optional[bytes]:
+        """Read the raw bytes of a sysfs file, returns None on error"""
+        fd = self._fd_cache.get(path)
         try:
-            return path.read_text().strip()
+            if fd is not None:
+                # sysfs regenerates the value on every read from offset 0,
+                # so a cached descriptor can be re-read without reopening
+                buf = os.pread(fd, 128, 0)
+            else:
+                # Raw os-level read; skips the TextIOWrapper that
+                # Path.read_text() builds for every call
+                fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+                try:
+                    buf = os.read(fd, 128)
+                finally:
+                    os.close(fd)
+            return buf
         except (FileNotFoundError, PermissionError, OSError) as e:
             # OSError can occur when sensor exists but has no data available
             return None
 
+    def _cache_fd(self, path: Path):
+        """Open a persistent read-only descriptor for a sysfs file polled every tick"""
+        try:
+            self._fd_cache[path] = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
+            pass  # read_file falls back to opening the path on every read
+
+    def open_pwm_fds(self):
+        """Keep write descriptors open for all PWM channels during automatic control"""
+        self._last_pwm.clear()
+        for pwm_path, _, _, _ in self.pwm_controls:
+            if pwm_path not in self._pwm_fds:
+                try:
+                    self._pwm_fds[pwm_path] = os.open(pwm_path, os.O_WRONLY | os.O_CLOEXEC)
+                except OSError:
+                    pass  # set_all_pwm_values falls back to write_file
+
+    def close_pwm_fds(self):
+        """Close the PWM write descriptors"""
+        for fd in self._pwm_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._pwm_fds.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the persistent sysfs file descriptors"""
+        self.close_pwm_fds()
+        for fd in self._fd_cache.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fd_cache.clear()
+
+        if self._nvml is not None:
+            try:
+                self._nvml.nvmlShutdown()
+            except Exception:
+                pass
+            self._nvml = None
+            self._nvml_handle = None
+
+        self._stop_gpu_monitor()
+
     def write_file(self, path: Path, value: str, silent: bool = False) -> bool:
         """Write a value to a sysfs file"""
+        # Any write may change a channel's mode or enable state
+        self._pwm_state_cache.clear()
         try:
             path.write_text(value)
             return True
         except (FileNotFoundError, PermissionError, OSError) as e:
             if not silent:
-                print(f"Error writing to {path}: {e}")
+                self.print_message(f"Error writing to {path}: {e}")
             return False
 
     def _detect_hardware(self):
@@ -144,64 +484,83 @@ class FanController:
             return
 
         # Scan all hwmon devices
-        for hwmon_dir in sorted(hwmon_base.iterdir()):
-            if not hwmon_dir.is_symlink() and not hwmon_dir.is_dir():
+        for entry in sorted(os.scandir(hwmon_base), key=lambda e: e.name):
+            if not entry.is_symlink() and not entry.is_dir():
                 continue
+            hwmon_dir = Path(entry.path)
+
+            # List the device directory once and match file names in Python
+            # instead of globbing and stat()ing each candidate file
+            try:
+                file_names = sorted(f.name for f in os.scandir(hwmon_dir))
+            except OSError:
+                continue
+            file_set = set(file_names)
 
             # Get device name
-            name_file = hwmon_dir / "name"
-            device_name = self.read_file(name_file) if name_file.exists() else hwmon_dir.name
+            device_name = self.read_file(hwmon_dir / "name") if "name" in file_set else hwmon_dir.name
 
             # Detect temperature sensors - all devices for display
-            for temp_file in sorted(hwmon_dir.glob("temp*_input")):
+            for name in file_names:
+                if not (name.startswith("temp") and name.endswith("_input")):
+                    continue
+                temp_file = hwmon_dir / name
+                sensor_name = name.removesuffix("_input")
+
                 # Get label if available
-                label_file = temp_file.parent / temp_file.name.replace("_input", "_label")
-                if label_file.exists():
-                    label = self.read_file(label_file)
+                if f"{sensor_name}_label" in file_set:
+                    label = self.read_file(hwmon_dir / f"{sensor_name}_label")
                 else:
                     # Generate label from device name and temp number
-                    temp_num = temp_file.name.replace("temp", "").replace("_input", "")
+                    temp_num = sensor_name.removeprefix("temp")
                     label = f"{device_name}_temp{temp_num}"
 
                 # Skip invalid sensors (check current reading)
                 value = self.read_file(temp_file)
                 if value:
                     try:
-                        temp_c = int(value) / 1000.0
+                        temp_c = int(value) / MILLIDEGREES_PER_DEGREE
                         # Skip sensors with unrealistic values
-                        if temp_c <= 0 or temp_c > 120:
+                        if temp_c <= TEMP_VALID_MIN or temp_c > TEMP_VALID_MAX:
                             continue
                     except (ValueError, TypeError):
                         continue
 
                 self.temp_sensors.append((temp_file, label, device_name))
+                self._cache_fd(temp_file)
 
             # Detect fan sensors
-            for fan_file in sorted(hwmon_dir.glob("fan*_input")):
+            for name in file_names:
+                if not (name.startswith("fan") and name.endswith("_input")):
+                    continue
+                fan_file = hwmon_dir / name
+                sensor_name = name.removesuffix("_input")
+
                 # Get label if available
-                label_file = fan_file.parent / fan_file.name.replace("_input", "_label")
-                if label_file.exists():
-                    label = self.read_file(label_file)
+                if f"{sensor_name}_label" in file_set:
+                    label = self.read_file(hwmon_dir / f"{sensor_name}_label")
                 else:
                     # Generate label from device name and fan number
-                    fan_num = fan_file.name.replace("fan", "").replace("_input", "")
+                    fan_num = sensor_name.removeprefix("fan")
                     label = f"{device_name}_fan{fan_num}"
 
                 self.fan_sensors.append((fan_file, label))
+                self._cache_fd(fan_file)
 
             # Detect PWM controls from any hwmon device
             # Scan all devices to find PWM controls (auto-detect)
-            for pwm_file in sorted(hwmon_dir.glob("pwm[0-9]*")):
+            for name in file_names:
                 # Skip files like pwm1_enable, pwm1_mode, etc.
-                if '_' in pwm_file.name:
+                if not (name.startswith("pwm") and name[3:4].isdigit()) or '_' in name:
                     continue
 
-                pwm_num = pwm_file.name.replace("pwm", "")
-                enable_file = pwm_file.parent / f"pwm{pwm_num}_enable"
-                mode_file = pwm_file.parent / f"pwm{pwm_num}_mode"
+                pwm_num = name.removeprefix("pwm")
+                pwm_file = hwmon_dir / name
+                enable_file = hwmon_dir / f"pwm{pwm_num}_enable"
+                mode_file = hwmon_dir / f"pwm{pwm_num}_mode"
 
                 # Only add if enable file exists (means it's controllable)
-                if enable_file.exists():
+                if enable_file.name in file_set:
                     label = f"PWM{pwm_num}"
                     # Update hwmon_path to point to the device with PWM controls
                     # (on first PWM control found)
@@ -209,8 +568,64 @@ class FanController:
                         self.hwmon_path = hwmon_dir
                         print(f"🔍 Auto-detected PWM control device: {device_name} ({hwmon_dir})")
                     self.pwm_controls.append((pwm_file, enable_file, mode_file, label))
+                    for path in (pwm_file, enable_file, mode_file):
+                        self._cache_fd(path)
+
+        # Pair each PWM channel with its fan sensor once, rather than
+        # searching the fan list by path string on every test
+        for pwm_path, _, _, _ in self.pwm_controls:
+            fan_name = f"fan{pwm_path.name.removeprefix('pwm')}"
+            for fan_path, fan_label in self.fan_sensors:
+                if fan_name in str(fan_path):
+                    self.pwm_fans[pwm_path] = (fan_path, fan_label)
+                    break
 
         # Check for NVIDIA GPU
+        self._detect_nvidia_gpu()
+
+        # Print detection summary
+        print(f"🔍 Detected {len(self.temp_sensors)} temperature sensor(s)")
+        print(f"🔍 Detected {len(self.fan_sensors)} fan sensor(s)")
+        print(f"🔍 Detected {len(self.pwm_controls)} PWM control(s)")
+
+    def _detect_nvidia_gpu(self):
+        """Add an NVIDIA GPU as a virtual temperature sensor if one is present
+
+        Prefers in-process NVML queries via pynvml; falls back to running
+        nvidia-smi when the bindings are not installed.
+        """
+        # Both paths need the NVIDIA kernel driver; without it don't load
+        # NVML or spawn anything
+        if not os.path.exists("/proc/driver/nvidia"):
+            return
+
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+        except Exception:
+            pynvml = None  # pynvml not installed or NVIDIA driver unusable
+        if pynvml is not None:
+            try:
+                handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+                gpu_name = pynvml.nvmlDeviceGetName(handle)
+                if isinstance(gpu_name, bytes):
+                    gpu_name = gpu_name.decode()
+                self._nvml = pynvml
+                self._nvml_handle = handle
+                self.temp_sensors.append(("nvml", gpu_name, "nvidia"))
+                return
+            except Exception:
+                # No usable GPU; release NVML before trying nvidia-smi
+                try:
+                    pynvml.nvmlShutdown()
+                except Exception:
+                    pass
+
+        if shutil.which("nvidia-smi") is None:
+            return
+
+        # subprocess is only loaded when the GPU has to be queried through nvidia-smi
+        import subprocess
         try:
             result = subprocess.run(
                 ["nvidia-smi", "--query-gpu=name,temperature.gpu", "--format=csv,noheader"],
@@ -220,15 +635,224 @@ class FanController:
             )
             if result.returncode == 0 and result.stdout.strip():
                 # Add GPU as a virtual temperature sensor
-                gpu_name = result.stdout.strip().split(',')[0].strip()
+                fields = result.stdout.strip().split(',')
+                gpu_name = fields[0].strip()
+                try:
+                    self._gpu_temp = float(fields[1])
+                except (IndexError, ValueError):
+                    pass  # First reading will come from the monitor
                 self.temp_sensors.append(("nvidia-smi", gpu_name, "nvidia"))
-        except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
-            pass  # NVIDIA tools not available or GPU not present
+                self._start_gpu_monitor()
+        except (OSError, subprocess.TimeoutExpired):
+            pass  # nvidia-smi failed to run or hung
 
-        # Print detection summary
-        print(f"🔍 Detected {len(self.temp_sensors)} temperature sensor(s)")
-        print(f"🔍 Detected {len(self.fan_sensors)} fan sensor(s)")
-        print(f"🔍 Detected {len(self.pwm_controls)} PWM control(s)")
+    def _start_gpu_monitor(self):
+        """Start a single nvidia-smi process that reports the GPU temperature every second
+
+        Avoids spawning nvidia-smi on every read; a reader thread keeps
+        self._gpu_temp updated with the latest value.
+        """
+        import subprocess
+        try:
+            self._gpu_monitor = subprocess.Popen(
+                ["nvidia-smi", "--id=0", "--query-gpu=temperature.gpu", "--format=csv,noheader", "-lms", "1000"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+        except OSError:
+            return  # Fall back to running nvidia-smi per read
+        threading.Thread(target=self._read_gpu_monitor, args=(self._gpu_monitor,), daemon=True).start()
+        # Make sure the child doesn't outlive us if close() is never reached
+        # (registered once, however often the monitor is restarted)
+        atexit.unregister(self._stop_gpu_monitor)
+        atexit.register(self._stop_gpu_monitor)
+
+    def _read_gpu_monitor(self, proc: "subprocess.Popen"):
+        """Reader thread: track the latest temperature printed by nvidia-smi"""
+        try:
+            for line in proc.stdout:
+                try:
+                    # Single writer, plain attribute assignment - no lock needed
+                    self._gpu_temp = float(line.strip())
+                    self._gpu_monitor_restarts = 0
+                except ValueError:
+                    pass  # Skip "[N/A]" and similar
+        except (OSError, ValueError):
+            pass  # Pipe closed by _stop_gpu_monitor
+        if self._gpu_monitor is proc:
+            self._gpu_temp = None  # nvidia-smi exited
+
+    def _stop_gpu_monitor(self):
+        """Terminate the nvidia-smi monitor process if it is running"""
+        proc, self._gpu_monitor = self._gpu_monitor, None
+        if proc is None:
+            return
+        import subprocess
+        proc.terminate()
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    def _test_single_pwm(self, pwm_path: Path, enable_path: Path, mode_path: Path, label: str,
+                         comprehensive: bool) -> List[str]:
+        """Test one PWM channel and return its report lines (see test_pwm_responsiveness)"""
+        lines = []
+
+        # Corresponding fan sensor, paired during hardware detection
+        fan_sensor = self.pwm_fans.get(pwm_path)
+        if not fan_sensor:
+            lines.append(f"   {label}: No fan sensor found, skipping test")
+            return lines
+
+        # Read current state
+        original_enable = self.read_file(enable_path)
+        original_pwm = self.read_file(pwm_path)
+        original_mode = self.read_file(mode_path)
+        initial_rpm_str = self.read_file(fan_sensor[0])
+
+        if not all([original_enable, original_pwm, original_mode, initial_rpm_str]):
+            lines.append(f"   {label}: Cannot read current state, skipping test")
+            return lines
+
+        try:
+            initial_rpm = int(initial_rpm_str)
+            original_pwm_val = int(original_pwm)
+
+            # Test modes - start with current mode
+            results = {}
+            original_mode_name = "PWM" if original_mode == "1" else "DC"
+
+            # Determine which modes to test
+            if comprehensive:
+                modes_to_test = [("PWM", "1"), ("DC", "0")]
+            else:
+                # Test current mode only
+                modes_to_test = [(original_mode_name, original_mode)]
+
+            for mode_name, mode_value in modes_to_test:
+                # Set to manual mode
+                self.write_file(enable_path, "1")
+
+                # Try to change mode (may not be supported by hardware)
+                if mode_value != original_mode:
+                    mode_changed = self.write_file(mode_path, mode_value, silent=True)
+                    if not mode_changed:
+                        # Hardware doesn't support this mode
+                        results[mode_name] = None
+                        continue
+
+                    # Wait longer after mode change for fan to stabilize
+                    time.sleep(3)
+                else:
+                    # Same mode, shorter wait
+                    time.sleep(1)
+
+                # Set a medium baseline PWM to start from stable state
+                baseline_pwm = 128
+                self.write_file(pwm_path, str(baseline_pwm))
+                time.sleep(3)  # Wait for fan to stabilize at baseline
+
+                # Get baseline RPM in this mode
+                baseline_rpm_str = self.read_file(fan_sensor[0])
+                if not baseline_rpm_str:
+                    results[mode_name] = None
+                    continue
+
+                baseline_rpm = int(baseline_rpm_str)
+
+                # Set a test PWM value (significantly different for clear response)
+                # Go high to see if fan speeds up
+                test_pwm = 220
+                self.write_file(pwm_path, str(test_pwm))
+
+                # Wait longer for fan to respond and stabilize
+                time.sleep(4)
+
+                # Measure new RPM
+                new_rpm_str = self.read_file(fan_sensor[0])
+                if new_rpm_str:
+                    new_rpm = int(new_rpm_str)
+                    rpm_change = abs(new_rpm - baseline_rpm)
+                    rpm_change_pct = (rpm_change / max(baseline_rpm, 1)) * 100
+
+                    results[mode_name] = {
+                        'baseline': baseline_rpm,
+                        'new': new_rpm,
+                        'change': rpm_change,
+                        'change_pct': rpm_change_pct,
+                        'responsive': rpm_change > 50 or rpm_change_pct > 5
+                    }
+                else:
+                    results[mode_name] = None
+
+                # Restore PWM to original
+                self.write_file(pwm_path, original_pwm)
+                time.sleep(1)
+
+            # Analyze results
+            pwm_responsive = results.get("PWM") and results["PWM"]["responsive"]
+            dc_responsive = results.get("DC") and results["DC"]["responsive"]
+
+            # For non-comprehensive mode, simplify output
+            if not comprehensive:
+                current_result = results.get(original_mode_name)
+                if current_result and current_result["responsive"]:
+                    lines.append(f"   {label}: ✓ Working correctly ({original_mode_name} mode) - RPM: {current_result['baseline']} → {current_result['new']} (Δ{current_result['change']:.0f})")
+                elif current_result:
+                    lines.append(f"   {label}: ⚠️  Not responding ({original_mode_name} mode) - RPM: {current_result['baseline']} → {current_result['new']} (Δ{current_result['change']:.0f})")
+                    lines.append(f"                May be misconfigured or broken fan")
+                else:
+                    lines.append(f"   {label}: ✗ Cannot test")
+                return lines
+
+            # Comprehensive mode analysis
+            if pwm_responsive and dc_responsive:
+                # Both modes work
+                pwm_change = results["PWM"]["change"]
+                dc_change = results["DC"]["change"]
+                if pwm_change > dc_change * 1.2:
+                    lines.append(f"   {label}: ✓ Works in both modes, PWM recommended (better response: {pwm_change:.0f} vs {dc_change:.0f} RPM)")
+                elif dc_change > pwm_change * 1.2:
+                    lines.append(f"   {label}: ✓ Works in both modes, DC recommended (better response: {dc_change:.0f} vs {pwm_change:.0f} RPM)")
+                else:
+                    lines.append(f"   {label}: ✓ Works equally in both modes (PWM: {pwm_change:.0f}, DC: {dc_change:.0f} RPM change)")
+
+                if original_mode_name not in ["PWM", "DC"] or \
+                   (original_mode_name == "PWM" and dc_change > pwm_change * 1.2) or \
+                   (original_mode_name == "DC" and pwm_change > dc_change * 1.2):
+                    lines.append(f"                ⚠️  Consider changing BIOS mode setting")
+
+            elif pwm_responsive and not dc_responsive:
+                if results.get("DC") is None:
+                    lines.append(f"   {label}: ✓ PWM mode only (hardware doesn't support DC) - RPM: {results['PWM']['baseline']} → {results['PWM']['new']}")
+                else:
+                    lines.append(f"   {label}: ✓ Works in PWM mode only (RPM: {results['PWM']['baseline']} → {results['PWM']['new']})")
+                    if original_mode != "1":
+                        lines.append(f"                ⚠️  MISCONFIGURATION: BIOS set to DC but device needs PWM!")
+
+            elif dc_responsive and not pwm_responsive:
+                lines.append(f"   {label}: ✓ Works in DC mode only (RPM: {results['DC']['baseline']} → {results['DC']['new']})")
+                if original_mode != "0":
+                    lines.append(f"                ⚠️  MISCONFIGURATION: BIOS set to PWM but device needs DC!")
+
+            else:
+                lines.append(f"   {label}: ✗ Not responsive in either mode or no fan connected")
+
+        except (ValueError, TypeError) as e:
+            lines.append(f"   {label}: Error during test: {e}")
+        finally:
+            # Restore original state
+            self.write_file(mode_path, original_mode)
+            self.write_file(pwm_path, original_pwm)
+            self.write_file(enable_path, original_enable)
+            time.sleep(0.5)
+
+        return lines
 
     def test_pwm_responsiveness(self, comprehensive: bool = False):
         """Test which PWM channels actually control responsive fans and detect optimal mode
@@ -252,234 +876,98 @@ class FanController:
         print()
         time.sleep(1)
 
+        # Test one channel at a time: hwmon pwmN -> fanN numbering is often
+        # wrong, and only a single changing channel shows which fan it drives
         for pwm_path, enable_path, mode_path, label in self.pwm_controls:
-            pwm_num = pwm_path.name.replace("pwm", "")
-
-            # Find corresponding fan sensor
-            fan_sensor = None
-            for fan_path, fan_label in self.fan_sensors:
-                if f"fan{pwm_num}" in str(fan_path):
-                    fan_sensor = (fan_path, fan_label)
-                    break
-
-            if not fan_sensor:
-                print(f"   {label}: No fan sensor found, skipping test")
-                continue
+            for line in self._test_single_pwm(pwm_path, enable_path, mode_path, label, comprehensive):
+                print(line)
 
-            # Read current state
-            original_enable = self.read_file(enable_path)
-            original_pwm = self.read_file(pwm_path)
-            original_mode = self.read_file(mode_path)
-            initial_rpm_str = self.read_file(fan_sensor[0])
-
-            if not all([original_enable, original_pwm, original_mode, initial_rpm_str]):
-                print(f"   {label}: Cannot read current state, skipping test")
-                continue
+        print("\n✓ PWM mode detection test completed\n")
 
+    def _read_temperature(self, sensor_path) -> Optional[float]:
+        """Read a single temperature sensor in °C, returns None if unavailable"""
+        # Handle NVIDIA GPU specially
+        if sensor_path == "nvml":
             try:
-                initial_rpm = int(initial_rpm_str)
-                original_pwm_val = int(original_pwm)
-
-                # Test modes - start with current mode
-                results = {}
-                original_mode_name = "PWM" if original_mode == "1" else "DC"
-
-                # Determine which modes to test
-                if comprehensive:
-                    modes_to_test = [("PWM", "1"), ("DC", "0")]
-                else:
-                    # Test current mode only
-                    modes_to_test = [(original_mode_name, original_mode)]
-
-                for mode_name, mode_value in modes_to_test:
-                    # Set to manual mode
-                    self.write_file(enable_path, "1")
-
-                    # Try to change mode (may not be supported by hardware)
-                    if mode_value != original_mode:
-                        mode_changed = self.write_file(mode_path, mode_value, silent=True)
-                        if not mode_changed:
-                            # Hardware doesn't support this mode
-                            results[mode_name] = None
-                            continue
-
-                        # Wait longer after mode change for fan to stabilize
-                        time.sleep(3)
-                    else:
-                        # Same mode, shorter wait
-                        time.sleep(1)
-
-                    # Set a medium baseline PWM to start from stable state
-                    baseline_pwm = 128
-                    self.write_file(pwm_path, str(baseline_pwm))
-                    time.sleep(3)  # Wait for fan to stabilize at baseline
-
-                    # Get baseline RPM in this mode
-                    baseline_rpm_str = self.read_file(fan_sensor[0])
-                    if not baseline_rpm_str:
-                        results[mode_name] = None
-                        continue
-
-                    baseline_rpm = int(baseline_rpm_str)
-
-                    # Set a test PWM value (significantly different for clear response)
-                    # Go high to see if fan speeds up
-                    test_pwm = 220
-                    self.write_file(pwm_path, str(test_pwm))
-
-                    # Wait longer for fan to respond and stabilize
-                    time.sleep(4)
-
-                    # Measure new RPM
-                    new_rpm_str = self.read_file(fan_sensor[0])
-                    if new_rpm_str:
-                        new_rpm = int(new_rpm_str)
-                        rpm_change = abs(new_rpm - baseline_rpm)
-                        rpm_change_pct = (rpm_change / max(baseline_rpm, 1)) * 100
-
-                        results[mode_name] = {
-                            'baseline': baseline_rpm,
-                            'new': new_rpm,
-                            'change': rpm_change,
-                            'change_pct': rpm_change_pct,
-                            'responsive': rpm_change > 50 or rpm_change_pct > 5
-                        }
-                    else:
-                        results[mode_name] = None
-
-                    # Restore PWM to original
-                    self.write_file(pwm_path, original_pwm)
-                    time.sleep(1)
-
-                # Analyze results
-                pwm_responsive = results.get("PWM") and results["PWM"]["responsive"]
-                dc_responsive = results.get("DC") and results["DC"]["responsive"]
-
-                # For non-comprehensive mode, simplify output
-                if not comprehensive:
-                    current_result = results.get(original_mode_name)
-                    if current_result and current_result["responsive"]:
-                        print(f"   {label}: ✓ Working correctly ({original_mode_name} mode) - RPM: {current_result['baseline']} → {current_result['new']} (Δ{current_result['change']:.0f})")
-                    elif current_result:
-                        print(f"   {label}: ⚠️  Not responding ({original_mode_name} mode) - RPM: {current_result['baseline']} → {current_result['new']} (Δ{current_result['change']:.0f})")
-                        print(f"                May be misconfigured or broken fan")
-                    else:
-                        print(f"   {label}: ✗ Cannot test")
-                    continue
-
-                # Comprehensive mode analysis
-                if pwm_responsive and dc_responsive:
-                    # Both modes work
-                    pwm_change = results["PWM"]["change"]
-                    dc_change = results["DC"]["change"]
-                    if pwm_change > dc_change * 1.2:
-                        print(f"   {label}: ✓ Works in both modes, PWM recommended (better response: {pwm_change:.0f} vs {dc_change:.0f} RPM)")
-                    elif dc_change > pwm_change * 1.2:
-                        print(f"   {label}: ✓ Works in both modes, DC recommended (better response: {dc_change:.0f} vs {pwm_change:.0f} RPM)")
-                    else:
-                        print(f"   {label}: ✓ Works equally in both modes (PWM: {pwm_change:.0f}, DC: {dc_change:.0f} RPM change)")
-
-                    if original_mode_name not in ["PWM", "DC"] or \
-                       (original_mode_name == "PWM" and dc_change > pwm_change * 1.2) or \
-                       (original_mode_name == "DC" and pwm_change > dc_change * 1.2):
-                        print(f"                ⚠️  Consider changing BIOS mode setting")
-
-                elif pwm_responsive and not dc_responsive:
-                    if results.get("DC") is None:
-                        print(f"   {label}: ✓ PWM mode only (hardware doesn't support DC) - RPM: {results['PWM']['baseline']} → {results['PWM']['new']}")
-                    else:
-                        print(f"   {label}: ✓ Works in PWM mode only (RPM: {results['PWM']['baseline']} → {results['PWM']['new']})")
-                        if original_mode != "1":
-                            print(f"                ⚠️  MISCONFIGURATION: BIOS set to DC but device needs PWM!")
-
-                elif dc_responsive and not pwm_responsive:
-                    print(f"   {label}: ✓ Works in DC mode only (RPM: {results['DC']['baseline']} → {results['DC']['new']})")
-                    if original_mode != "0":
-                        print(f"                ⚠️  MISCONFIGURATION: BIOS set to PWM but device needs DC!")
-
-                else:
-                    print(f"   {label}: ✗ Not responsive in either mode or no fan connected")
+                return float(self._nvml.nvmlDeviceGetTemperature(
+                    self._nvml_handle, self._nvml.NVML_TEMPERATURE_GPU))
+            except Exception:
+                return None  # GPU temp unavailable
+        if sensor_path == "nvidia-smi":
+            monitor = self._gpu_monitor
+            if monitor is not None:
+                if monitor.poll() is None:
+                    return self._gpu_temp
+                # nvidia-smi exited (driver reload, Xid, crash): start a new
+                # monitor and answer this read with a one-shot query. One that
+                # keeps exiting without output (driver mismatch) is given up on.
+                self._stop_gpu_monitor()
+                if self._gpu_monitor_restarts < self.GPU_MONITOR_MAX_RESTARTS:
+                    self._gpu_monitor_restarts += 1
+                    self._start_gpu_monitor()
+            import subprocess
+            try:
+                result = subprocess.run(
+                    ["nvidia-smi", "--query-gpu=temperature.gpu", "--format=csv,noheader"],
+                    capture_output=True,
+                    text=True,
+                    timeout=2
+                )
+                if result.returncode == 0 and result.stdout.strip():
+                    return float(result.stdout.strip())
+            except (FileNotFoundError, subprocess.TimeoutExpired, ValueError, Exception):
+                pass  # GPU temp unavailable
+            return None
 
-            except (ValueError, TypeError) as e:
-                print(f"   {label}: Error during test: {e}")
-            finally:
-                # Restore original state
-                self.write_file(mode_path, original_mode)
-                self.write_file(pwm_path, original_pwm)
-                self.write_file(enable_path, original_enable)
-                time.sleep(0.5)
+        # Regular sysfs sensor
+        value = self.read_int(sensor_path)
+        if value is not None:
+            temp_c = value / MILLIDEGREES_PER_DEGREE
+            # Skip invalid readings
+            if TEMP_VALID_MIN < temp_c < TEMP_VALID_MAX:
+                return temp_c
+        return None
 
-        print("\n✓ PWM mode detection test completed\n")
+    def _read_fan_speed(self, fan_path: Path) -> Optional[int]:
+        """Read a single fan sensor in RPM, returns None if unavailable"""
+        # Include 0 RPM - fan could be stopped due to low temp/PWM
+        return self.read_int(fan_path)
+
+    def _cached_reading(self, kind: str, read):
+        """Return readings of the given kind, reusing ones taken within sensor_ttl"""
+        now = time.monotonic()
+        if self.sensor_ttl > 0:
+            cached = self._reading_cache.get(kind)
+            if cached is not None and now - cached[0] < self.sensor_ttl:
+                return cached[1]
+        readings = read()
+        self._reading_cache[kind] = (now, readings)
+        return readings
 
     def get_temperatures(self) -> Dict[str, float]:
         """Get all available temperature sensors"""
-        temps = {}
-
-        for sensor_path, label, device_name in self.temp_sensors:
-            # Handle NVIDIA GPU specially
-            if sensor_path == "nvidia-smi":
-                try:
-                    result = subprocess.run(
-                        ["nvidia-smi", "--query-gpu=temperature.gpu", "--format=csv,noheader"],
-                        capture_output=True,
-                        text=True,
-                        timeout=2
-                    )
-                    if result.returncode == 0 and result.stdout.strip():
-                        temp = float(result.stdout.strip())
-                        temps[label] = temp
-                except (FileNotFoundError, subprocess.TimeoutExpired, ValueError, Exception):
-                    pass  # GPU temp unavailable
-            else:
-                # Regular sysfs sensor
-                value = self.read_file(sensor_path)
-                if value:
-                    try:
-                        temp_c = int(value) / 1000.0
-                        # Skip invalid readings
-                        if 0 < temp_c < 120:
-                            temps[label] = temp_c
-                    except (ValueError, TypeError):
-                        pass  # Skip invalid values
-
-        return temps
-
-    def get_control_temperatures(self) -> Dict[str, float]:
-        """Get temperatures for PWM control (CPU cores + GPU only)"""
-        temps = {}
+        return self._cached_reading("temps", self._read_temperatures)
 
-        for sensor_path, label, device_name in self.temp_sensors:
-            # Only include coretemp (CPU cores/package) and nvidia (GPU)
-            if device_name not in ['coretemp', 'nvidia']:
-                continue
+    def _read_temperatures(self) -> Dict[str, float]:
+        """Read every temperature sensor"""
+        read_temperature = self._read_temperature
+        return {label: temp for sensor_path, label, _ in self.temp_sensors
+                if (temp := read_temperature(sensor_path)) is not None}
 
-            # Handle NVIDIA GPU specially
-            if sensor_path == "nvidia-smi":
-                try:
-                    result = subprocess.run(
-                        ["nvidia-smi", "--query-gpu=temperature.gpu", "--format=csv,noheader"],
-                        capture_output=True,
-                        text=True,
-                        timeout=2
-                    )
-                    if result.returncode == 0 and result.stdout.strip():
-                        temp = float(result.stdout.strip())
-                        temps[label] = temp
-                except (FileNotFoundError, subprocess.TimeoutExpired, ValueError, Exception):
-                    pass  # GPU temp unavailable
-            else:
-                # Regular sysfs sensor
-                value = self.read_file(sensor_path)
-                if value:
-                    try:
-                        temp_c = int(value) / 1000.0
-                        # Skip invalid readings
-                        if 0 < temp_c < 120:
-                            temps[label] = temp_c
-                    except (ValueError, TypeError):
-                        pass  # Skip invalid values
+    def get_control_temperatures(self, share_with_display: bool = False) -> Dict[str, float]:
+        """Get temperatures for PWM control (CPU cores + GPU only)
 
-        return temps
+        With share_with_display, every sensor is read (and cached) so a
+        display drawn in the same tick can reuse the reading; otherwise only
+        the control sensors are touched, leaving e.g. NVMe drives asleep.
+        """
+        if share_with_display:
+            control_sensors = self._control_sensor_set
+            return {label: temp for label, temp in self.get_temperatures().items()
+                    if label in control_sensors}
+        read_temperature = self._read_temperature
+        return {label: temp for sensor_path, label in self._control_sensors
+                if (temp := read_temperature(sensor_path)) is not None}
 
     def get_control_sensor_names(self) -> set:
         """Get names of sensors used for PWM control"""
@@ -491,50 +979,51 @@ class FanController:
 
     def get_fan_speeds(self) -> Dict[str, int]:
         """Get current fan speeds in RPM"""
-        speeds = {}
+        return self._cached_reading("fans", self._read_fan_speeds)
 
-        for fan_path, label in self.fan_sensors:
-            value = self.read_file(fan_path)
-            if value:
-                try:
-                    rpm = int(value)
-                    # Include 0 RPM - fan could be stopped due to low temp/PWM
-                    speeds[label] = rpm
-                except (ValueError, TypeError):
-                    pass  # Skip invalid values
-
-        return speeds
+    def _read_fan_speeds(self) -> Dict[str, int]:
+        """Read every fan speed sensor"""
+        read_fan_speed = self._read_fan_speed
+        return {label: rpm for fan_path, label in self.fan_sensors
+                if (rpm := read_fan_speed(fan_path)) is not None}
 
     def get_pwm_values(self) -> Dict[str, Tuple[int, int]]:
         """Get current PWM values and modes (value, mode)"""
+        return self._cached_reading("pwm", self._read_pwm_values)
+
+    def _read_pwm_values(self) -> Dict[str, Tuple[int, int]]:
+        """Read value, mode and enable state of every PWM channel"""
         pwm_info = {}
 
         for pwm_path, enable_path, mode_path, label in self.pwm_controls:
-            value = self.read_file(pwm_path)
-            mode = self.read_file(mode_path)
-            enable = self.read_file(enable_path)
-
-            if value:
-                try:
-                    pwm_value = int(value)
-                    pwm_percent = pwm_value / 255.0 * 100
-
-                    mode_str = "PWM" if mode == "1" else "DC" if mode else "unknown"
-                    enable_str = {
-                        "0": "off/full",
-                        "1": "manual",
-                        "2": "auto",
-                        "3": "auto",
-                        "4": "auto",
-                        "5": "auto"
-                    }.get(enable, "unknown")
-
-                    pwm_info[label] = (pwm_value, pwm_percent, mode_str, enable_str)
-                except (ValueError, TypeError):
-                    pass  # Skip invalid values
+            pwm_value = self.read_int(pwm_path)
+            if pwm_value is None:
+                continue  # Skip missing or invalid values
+            pwm_percent = PWM_PERCENT[pwm_value] if 0 <= pwm_value <= 255 else pwm_value / 255.0 * 100
+
+            # Mode and enable only change when written, so they are
+            # read once and cached until the next write_file()
+            state = self._pwm_state_cache.get(pwm_path)
+            if state is None:
+                mode = self.read_file(mode_path)
+                enable = self.read_file(enable_path)
+                mode_str = "PWM" if mode == "1" else "DC" if mode else "unknown"
+                enable_str = self.PWM_ENABLE_NAMES.get(enable, "unknown")
+                state = self._pwm_state_cache[pwm_path] = (mode_str, enable_str)
+
+            pwm_info[label] = (pwm_value, pwm_percent, *state)
 
         return pwm_info
 
+    def read_all_sensors_batch(self) -> Tuple[Dict[str, float], Dict[str, int], Dict[str, Tuple]]:
+        """Read every temperature, fan and PWM sensor in a single pass
+
+        Returns (temperatures, fan speeds, PWM info). Each sensor is read
+        exactly once, so callers needing several of these per tick should use
+        this instead of calling the individual getters back-to-back.
+        """
+        return self.get_temperatures(), self.get_fan_speeds(), self.get_pwm_values()
+
     def calculate_pwm_from_temp(self, temp: float) -> int:
         """Calculate PWM value based on temperature using linear curve"""
         if temp <= self.temp_min:
@@ -549,10 +1038,14 @@ class FanController:
 
     def set_pwm_manual_mode(self, pwm_path: Path, enable_path: Path) -> bool:
         """Set a PWM channel to manual mode"""
+        # The driver may reset the duty cycle on a mode change
+        self._last_pwm.pop(pwm_path, None)
         return self.write_file(enable_path, "1")
 
     def restore_bios_control(self, enable_path: Path) -> bool:
         """Restore BIOS/automatic control for a PWM channel"""
+        # Firmware takes over the duty cycle, so forget what we wrote
+        self._last_pwm.clear()
         # Try to write "2" for auto mode
         write_result = self.write_file(enable_path, "2")
 
@@ -589,83 +1082,174 @@ class FanController:
             print(f"⚠ Restored BIOS control for {success_count}/{total_pwms} PWM channels")
             print(f"  Failed PWMs set to 50% manual speed: {', '.join(failed_pwms)}")
 
-    def set_pwm_value(self, pwm_path: Path, value: int) -> bool:
-        """Set PWM value (0-255)"""
+    def set_all_pwm_values(self, value: int):
+        """Set every PWM channel to the same value (0-255)"""
         if not 0 <= value <= 255:
-            print(f"Invalid PWM value: {value} (must be 0-255)")
-            return False
+            self.print_message(f"Invalid PWM value: {value} (must be 0-255)")
+            return
 
-        return self.write_file(pwm_path, str(value))
+        # Validate once per tick, then issue one pwrite per channel
+        # whose value moved past the dead band; in steady state that is none.
+        # The curve's end points are always written so fans reach them exactly.
+        last_pwm = self._last_pwm
+        hold = value != self.pwm_min and value != self.pwm_max
+        payload = PWM_BYTES[value]
+        for pwm_path, _, _, _ in self.pwm_controls:
+            last = last_pwm.get(pwm_path)
+            if last == value or (hold and last is not None and abs(value - last) < self.PWM_DEAD_BAND):
+                continue
+            self._reading_cache.pop("pwm", None)
+
+            fd = self._pwm_fds.get(pwm_path)
+            if fd is None:
+                if self.write_file(pwm_path, str(value)):
+                    last_pwm[pwm_path] = value
+                continue
+            try:
+                os.pwrite(fd, payload, 0)
+                last_pwm[pwm_path] = value
+            except OSError as e:
+                self.print_message(f"Error writing to {pwm_path}: {e}")
 
     def get_temp_color(self, temp: float) -> str:
         """Get color code based on temperature"""
-        if temp < 50:
-            return self.COLOR_GREEN
-        elif temp < 70:
-            return self.COLOR_YELLOW
-        else:
-            return self.COLOR_RED
+        return self._temp_colors[min(max(int(temp), 0), 120)]
+
+    def get_percent_color(self, percent: float) -> str:
+        """Get color code based on a 0-100% load value"""
+        return self._percent_colors[min(max(int(percent), 0), 100)]
 
     def get_fan_color(self, rpm: float, max_rpm: float = 3000) -> str:
         """Get color code based on fan speed"""
-        percent = (rpm / max_rpm) * 100
-        if percent < 40:
-            return self.COLOR_GREEN
-        elif percent < 70:
-            return self.COLOR_YELLOW
-        else:
-            return self.COLOR_RED
+        return self.get_percent_color((rpm / max_rpm) * 100)
+
+    def _make_bar(self, color: str, filled: int, width: int) -> str:
+        """Build a colored horizontal bar of the given width with 'filled' solid cells"""
+        key = (color, filled, width)
+        bar = self._bar_cache.get(key)
+        if bar is None:
+            bar = self._bar_cache[key] = "".join((color, self._FULL_BAR[:max(0, filled)], self.COLOR_RESET,
+                                                  self._EMPTY_BAR[:max(0, width - filled)]))
+        return bar
 
     def record_history(self, max_temp: float, avg_fan_speed: float):
         """Record temperature and fan speed to history"""
         self.temp_history.append(max_temp)
         self.fan_history.append(avg_fan_speed)
 
-    def create_vertical_bars(self, data: deque, max_value: float, width: int = 60, height: int = 8,
+    def _graph_thresholds(self, max_value: float, height: int) -> Tuple[List[float], List[float]]:
+        """Return (full, half) row thresholds for a graph scale, computed once per scale"""
+        key = (max_value, height)
+        thresholds = self._threshold_cache.get(key)
+        if thresholds is None:
+            half_step = max_value / height / 2
+            full = [(row / height) * max_value for row in range(1, height + 1)]
+            thresholds = self._threshold_cache[key] = (full, [threshold - half_step for threshold in full])
+        return thresholds
+
+    def create_vertical_bars(self, data: List[float], max_value: float, width: int = 60, height: int = 8,
                             is_temp: bool = True) -> List[str]:
-        """Create vertical bar chart from historical data with color coding"""
+        """Create vertical bar chart from historical samples (oldest first) with color coding"""
         if not data:
-            return ["░" * width] * height
+            return [self._EMPTY_BAR[:max(0, width)]] * height
+
+        # Show only the most recent 'width' samples to match graph size;
+        # a window that already fits is used without copying
+        display_data = data if len(data) <= width else data[-width:]
+        # Pad with zeros if needed
+        if len(display_data) < width:
+            display_data = list(display_data) + [0] * (width - len(display_data))
+
+        # Color depends only on the value, so pick each column's cached
+        # (full, half) cell strings once rather than building them per cell
+        cell_cache = self._cell_cache
+        if is_temp:
+            cells = [cell_cache[self.get_temp_color(value)] for value in display_data]
+        else:
+            cells = [cell_cache[self.get_fan_color(value, max_value)] for value in display_data]
+
+        # Row thresholds, bottom row first; a column fills every row whose
+        # threshold it reaches and gets a half block on the next one
+        thresholds, half_thresholds = self._graph_thresholds(max_value, height)
+
+        # Look up each whole column (top to bottom), then transpose into rows;
+        # only a few dozen distinct columns exist, so they are built once
+        column_cache = self._column_cache
+        columns = []
+        for value, cell in zip(display_data, cells):
+            full = bisect_right(thresholds, value)
+            half = bisect_right(half_thresholds, value) - full
+            key = (cell, full, half, height)
+            column = column_cache.get(key)
+            if column is None:
+                full_cell, half_cell = cell
+                column = column_cache[key] = (
+                    (' ',) * (height - full - half) + (half_cell,) * half + (full_cell,) * full
+                )
+            columns.append(column)
+
+        return [''.join(row) for row in zip(*columns)]
+
+    def print_message(self, message: str):
+        """Print a line outside the rendered frame and repaint the next frame in full"""
+        print(message)
+        # The message may have scrolled the screen under the frame
+        self._screen_lines = None
+        self._last_render_key = None
+
+    def write_frame(self, frame):
+        """Write a complete frame (str or pre-encoded bytes) to stdout with a single write() where possible"""
+        # Flush anything print()ed earlier so it stays ahead of the frame
+        sys.stdout.flush()
+        data = memoryview(frame if isinstance(frame, bytes) else frame.encode())
+        fd = sys.stdout.fileno()
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        except BrokenPipeError:
+            pass
 
-        # Show only the most recent 'width' samples to match graph size
-        data_list = list(data)
-        data_points = len(data_list)
+    @staticmethod
+    def _display_width(line: str) -> int:
+        """Approximate terminal columns used by a line (ANSI codes excluded, wide glyphs count as 2)"""
+        text = ANSI_ESCAPE.sub("", line)
+        if text.isascii():
+            return len(text)
+        return sum(2 if unicodedata.east_asian_width(char) in "WF" else 1 for char in text)
+
+    def _compute_layout(self, sep_width: int, temps: Dict[str, float], speeds: Dict[str, int],
+                        pwm_info: Dict[str, Tuple]) -> Tuple:
+        """Compute widths, separators, sensor order and line templates for the status display"""
+        # Find maximum label lengths for each section
+        max_temp_label = max(len(name) for name in temps.keys()) if temps else 12
+        max_fan_label = max(len(name) for name in speeds.keys()) if speeds else 12
+        max_pwm_label = max(len(name) for name in pwm_info.keys()) if pwm_info else 12
 
-        if data_points <= width:
-            # Show all available data
-            display_data = data_list
-            # Pad with zeros if needed
-            display_data.extend([0] * (width - len(display_data)))
-        else:
-            # Show only the most recent 'width' samples
-            display_data = data_list[-width:]
+        # Calculate bar widths dynamically to fill the terminal width
+        # Temperature format: "  {name:Ns}: {temp:5.1f}°C  [{bar}]"
+        # Fixed parts: 2 (indent) + N (label) + 2 (": ") + 5 (temp) + 2 ("°C") + 2 ("  ") + 1 ("[") + 1 ("]") = 15 + N
+        temp_bar_width = max(20, sep_width - (15 + max_temp_label))
 
-        # Create the vertical bars with colors
-        lines = []
-        for row in range(height, 0, -1):
-            line_chars = []
-            threshold = (row / height) * max_value
-            for value in display_data:
-                # Determine color based on value
-                if is_temp:
-                    color = self.get_temp_color(value)
-                else:
-                    color = self.get_fan_color(value, max_value)
+        # Fan speed format: "  {name:Ns}: {rpm:4d} RPM  [{bar}]"
+        # Fixed parts: 2 + N + 2 + 4 + 4 + 2 + 1 + 1 = 16 + N
+        fan_bar_width = max(20, sep_width - (16 + max_fan_label))
 
-                if value >= threshold:
-                    line_chars.append(color + '█' + self.COLOR_RESET)
-                elif value >= threshold - (max_value / height / 2):
-                    # Half block for smoother transition
-                    line_chars.append(color + '▄' + self.COLOR_RESET)
-                else:
-                    line_chars.append(' ')
-            lines.append(''.join(line_chars))
+        # PWM format: "  {name:Ns}: {value:3d}/255 ({percent:5.1f}%)  [{bar}]"
+        # Fixed parts: 2 + N + 2 + 3 + 4 + 2 + 5 + 3 + 2 + 1 + 1 = 25 + N
+        pwm_bar_width = max(20, sep_width - (25 + max_pwm_label))
 
-        return lines
+        # Line templates with the label widths baked in; highlighted names
+        # carry invisible color codes, so their field is widened to match
+        temp_tpl = f"  {{name:{max_temp_label}s}}: {{temp:5.1f}}°C  [{{bar}}]"
+        control_tpl = f"  {{name:{max_temp_label + self._HIGHLIGHT_EXTRA}s}}: {{temp:5.1f}}°C  [{{bar}}]"
+        fan_tpl = f"  {{name:{max_fan_label}s}}: {{rpm:4d}} RPM  [{{bar}}]"
+        pwm_tpl = f"  {{name:{max_pwm_label}s}}: {{value:3d}}/255 ({{percent:5.1f}}%)  [{{bar}}]"
 
-    def clear_screen(self):
-        """Clear screen and move cursor to top using ANSI escape codes"""
-        print("\033[H\033[J", end="", flush=True)
+        return (max_temp_label, max_fan_label, max_pwm_label,
+                temp_bar_width, fan_bar_width, pwm_bar_width,
+                "=" * sep_width, "-" * sep_width,
+                sorted(temps), sorted(speeds), sorted(pwm_info),
+                temp_tpl, control_tpl, fan_tpl, pwm_tpl)
 
     def display_status(self, clear: bool = False, show_history: bool = False, control_info: str = ""):
         """Display current temperatures and fan speeds"""
@@ -677,12 +1261,13 @@ class FanController:
         output = []
 
         # Get all data first
-        temps = self.get_temperatures()
-        speeds = self.get_fan_speeds()
-        pwm_info = self.get_pwm_values()
-        # Use control temperatures (CPU cores + GPU) for max temp calculation
-        control_temps = self.get_control_temperatures()
-        max_temp = max(control_temps.values()) if control_temps else 0
+        temps, speeds, pwm_info = self.read_all_sensors_batch()
+        # Get control sensor names for highlighting and max temp calculation
+        control_sensors = self._control_sensor_set
+        # Use control temperatures (CPU cores + GPU) for max temp calculation,
+        # taken from the batch above instead of reading those sensors again
+        control_temps = [temp for name, temp in temps.items() if name in control_sensors]
+        max_temp = max(control_temps) if control_temps else 0
         avg_fan_speed = sum(speeds.values()) / len(speeds) if speeds else 0
 
         # Record history
@@ -692,127 +1277,163 @@ class FanController:
         # Calculate display widths based on terminal size
         sep_width = min(self.term_width, 140)
 
-        # Find maximum label lengths for each section
-        max_temp_label = max(len(name) for name in temps.keys()) if temps else 12
-        max_fan_label = max(len(name) for name in speeds.keys()) if speeds else 12
-        max_pwm_label = max(len(name) for name in pwm_info.keys()) if pwm_info else 12
-
-        # Calculate bar widths dynamically to fill the terminal width
-        # Temperature format: "  {name:Ns}: {temp:5.1f}°C  [{bar}]"
-        # Fixed parts: 2 (indent) + N (label) + 2 (": ") + 5 (temp) + 2 ("°C") + 2 ("  ") + 1 ("[") + 1 ("]") = 15 + N
-        temp_bar_width = max(20, sep_width - (15 + max_temp_label))
-
-        # Fan speed format: "  {name:Ns}: {rpm:4d} RPM  [{bar}]"
-        # Fixed parts: 2 + N + 2 + 4 + 4 + 2 + 1 + 1 = 16 + N
-        fan_bar_width = max(20, sep_width - (16 + max_fan_label))
-
-        # PWM format: "  {name:Ns}: {value:3d}/255 ({percent:5.1f}%)  [{bar}]"
-        # Fixed parts: 2 + N + 2 + 3 + 4 + 2 + 5 + 3 + 2 + 1 + 1 = 25 + N
-        pwm_bar_width = max(20, sep_width - (25 + max_pwm_label))
+        # Calculate graph width to match separator width
+        # Need room for: "  100.0 │" (9 chars) + graph + "│" (1 char) = 10 + graph
+        # Don't limit by history_size - create_vertical_bars will compress data to fit
+        graph_width = sep_width - 10
+        show_graphs = show_history and len(self.temp_history) > 1
+        if show_graphs:
+            temp_window = self.temp_history.recent(graph_width)
+            fan_window = self.fan_history.recent(graph_width)
+            history_stats = (*self.temp_history.bounds(), *self.fan_history.bounds(), len(self.temp_history))
+        else:
+            temp_window = fan_window = history_stats = None
+
+        # Skip the redraw entirely when the frame would be identical to the
+        # one already on screen (common while the system is idle)
+        render_key = (tuple(temps.items()), tuple(speeds.items()), tuple(pwm_info.items()),
+                      control_info, sep_width, temp_window, fan_window, history_stats)
+        if render_key == self._last_render_key:
+            return max_temp
+        self._last_render_key = render_key
+
+        # Layout only changes when the terminal is resized or the sensor set
+        # changes, so reuse the widths, separators and sorted sensor names
+        # from the last frame
+        layout_key = (sep_width, tuple(temps), tuple(speeds), tuple(pwm_info))
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            self._layout = self._compute_layout(sep_width, temps, speeds, pwm_info)
+            self._bar_cache.clear()
+        (max_temp_label, max_fan_label, max_pwm_label,
+         temp_bar_width, fan_bar_width, pwm_bar_width, sep_eq, sep_dash,
+         temp_order, fan_order, pwm_order,
+         temp_tpl, control_tpl, fan_tpl, pwm_tpl) = self._layout
 
         # Build output
-        output.append("\n" + "=" * sep_width)
+        output.append("\n" + sep_eq)
         output.append("SYSTEM MONITORING")
-        output.append("=" * sep_width)
+        output.append(sep_eq)
 
         # Display temperatures
         output.append("\n📊 TEMPERATURES:")
-        output.append("-" * sep_width)
-
-        # Get control sensor names for highlighting
-        control_sensors = self.get_control_sensor_names()
-
-        for name, temp in sorted(temps.items()):
-            bar_length = int(temp / 100 * temp_bar_width)
-            color = self.get_temp_color(temp)
-            bar = color + "█" * bar_length + self.COLOR_RESET + "░" * (temp_bar_width - bar_length)
-            # Highlight control sensors with cyan color
-            if name in control_sensors:
-                name_display = f"{self.COLOR_CYAN}{name}{self.COLOR_RESET}"
-                output.append(f"  {name_display:{max_temp_label + len(self.COLOR_CYAN) + len(self.COLOR_RESET)}s}: {temp:5.1f}°C  [{bar}]")
-            else:
-                output.append(f"  {name:{max_temp_label}s}: {temp:5.1f}°C  [{bar}]")
-
-        max_temp_color = self.get_temp_color(max_temp)
-        output.append(f"\n  {'Max Temp':{max_temp_label}s}: {max_temp_color}{max_temp:5.1f}°C{self.COLOR_RESET}")
+        output.append(sep_dash)
+
+        # Bind per-frame constants to locals for the render loops
+        make_bar = self._make_bar
+        temp_color = self.get_temp_color
+        fan_color = self.get_fan_color
+        percent_color = self.get_percent_color
+        cyan, reset = self.COLOR_CYAN, self.COLOR_RESET
+        temp_line, control_line = temp_tpl.format, control_tpl.format
+
+        # Highlight control sensors with cyan color
+        output.extend([
+            control_line(name=cyan + name + reset, temp=temp,
+                         bar=make_bar(temp_color(temp), int(temp / 100 * temp_bar_width), temp_bar_width))
+            if name in control_sensors else
+            temp_line(name=name, temp=temp,
+                      bar=make_bar(temp_color(temp), int(temp / 100 * temp_bar_width), temp_bar_width))
+            for name, temp in zip(temp_order, map(temps.__getitem__, temp_order))
+        ])
+
+        max_temp_color = temp_color(max_temp)
+        output.append(f"\n  {'Max Temp':{max_temp_label}s}: {max_temp_color}{max_temp:5.1f}°C{reset}")
 
         # Display fan speeds
         output.append("\n🌀 FAN SPEEDS:")
-        output.append("-" * sep_width)
+        output.append(sep_dash)
 
-        for name, rpm in sorted(speeds.items()):
-            bar_length = int(min(rpm / 3000 * fan_bar_width, fan_bar_width))
-            color = self.get_fan_color(rpm, 3000)
-            bar = color + "█" * bar_length + self.COLOR_RESET + "░" * (fan_bar_width - bar_length)
-            output.append(f"  {name:{max_fan_label}s}: {rpm:4d} RPM  [{bar}]")
+        fan_line = fan_tpl.format
+        output.extend([
+            fan_line(name=name, rpm=rpm,
+                     bar=make_bar(fan_color(rpm, 3000), int(min(rpm / 3000 * fan_bar_width, fan_bar_width)), fan_bar_width))
+            for name, rpm in zip(fan_order, map(speeds.__getitem__, fan_order))
+        ])
 
-        avg_color = self.get_fan_color(avg_fan_speed, 3000)
-        output.append(f"\n  {'Avg Speed':{max_fan_label}s}: {avg_color}{avg_fan_speed:4.0f} RPM{self.COLOR_RESET}")
+        avg_color = fan_color(avg_fan_speed, 3000)
+        output.append(f"\n  {'Avg Speed':{max_fan_label}s}: {avg_color}{avg_fan_speed:4.0f} RPM{reset}")
 
         # Display PWM values
         output.append("\n⚙️  PWM CONTROLS:")
-        output.append("-" * sep_width)
-
-        for name, (value, percent, mode, enable) in sorted(pwm_info.items()):
-            bar_length = int(percent / 100 * pwm_bar_width)
-            # Color based on PWM percentage (similar to fan speed)
-            if percent < 40:
-                color = self.COLOR_GREEN
-            elif percent < 70:
-                color = self.COLOR_YELLOW
-            else:
-                color = self.COLOR_RED
-            bar = color + "█" * bar_length + self.COLOR_RESET + "░" * (pwm_bar_width - bar_length)
-            output.append(f"  {name:{max_pwm_label}s}: {value:3d}/255 ({percent:5.1f}%)  [{bar}]")
+        output.append(sep_dash)
+
+        # Color based on PWM percentage (similar to fan speed)
+        pwm_line = pwm_tpl.format
+        output.extend([
+            pwm_line(name=name, value=value, percent=percent,
+                     bar=make_bar(percent_color(percent), int(percent / 100 * pwm_bar_width), pwm_bar_width))
+            for name, (value, percent, mode, enable) in zip(pwm_order, map(pwm_info.__getitem__, pwm_order))
+        ])
 
         # Display history graphs
-        if show_history and len(self.temp_history) > 1:
+        if show_graphs:
             output.append("\n📈 HISTORY:")
-            output.append("-" * sep_width)
+            output.append(sep_dash)
 
-            # Calculate graph width to match separator width
-            # Need room for: "  100.0 │" (9 chars) + graph + "│" (1 char) = 10 + graph
-            # Don't limit by history_size - create_vertical_bars will compress data to fit
-            graph_width = sep_width - 10
+            temp_min, temp_max_val, fan_min, fan_max_val, history_len = history_stats
 
             # Temperature history
-            temp_min = min(self.temp_history)
-            temp_max_val = max(self.temp_history)
-            # self.temp_history.maxlen = graph_width
-            temp_bars = self.create_vertical_bars(self.temp_history, 100.0, width=graph_width, height=8, is_temp=True)
-            temp_color = self.get_temp_color(max_temp)
-            output.append(f"  Temperature (°C)  Max: {temp_max_val:.1f}  Min: {temp_min:.1f}  Current: {temp_color}{max_temp:.1f}{self.COLOR_RESET}")
+            temp_bars = self.create_vertical_bars(temp_window, 100.0, width=graph_width, height=8, is_temp=True)
+            output.append(f"  Temperature (°C)  Max: {temp_max_val:.1f}  Min: {temp_min:.1f}  Current: {max_temp_color}{max_temp:.1f}{reset}")
             for i, line in enumerate(temp_bars):
                 value = 100.0 * (8 - i) / 8
                 output.append(f"  {value:5.1f} │{line}│")
-            output.append(f"    0.0 └{'─' * graph_width}┘")
+            output.append(f"    0.0 └{self._HR[:max(0, graph_width)]}┘")
 
             output.append("")  # Blank line between graphs
 
             # Fan speed history
-            fan_min = min(self.fan_history)
-            fan_max_val = max(self.fan_history)
-            # self.fan_history.maxlen = graph_width;
-            fan_bars = self.create_vertical_bars(self.fan_history, 3000.0, width=graph_width, height=8, is_temp=False)
-            fan_color = self.get_fan_color(avg_fan_speed, 3000)
-            output.append(f"  Fan Speed (RPM)   Max: {fan_max_val:.0f}  Min: {fan_min:.0f}  Current: {fan_color}{avg_fan_speed:.0f}{self.COLOR_RESET}")
+            fan_bars = self.create_vertical_bars(fan_window, 3000.0, width=graph_width, height=8, is_temp=False)
+            output.append(f"  Fan Speed (RPM)   Max: {fan_max_val:.0f}  Min: {fan_min:.0f}  Current: {avg_color}{avg_fan_speed:.0f}{reset}")
             for i, line in enumerate(fan_bars):
                 value = 3000.0 * (8 - i) / 8
                 output.append(f"  {value:5.0f} │{line}│")
-            output.append(f"      0 └{'─' * graph_width}┘")
-            output.append(f"        Last {len(self.temp_history)} samples")
+            output.append(f"      0 └{self._HR[:max(0, graph_width)]}┘")
+            output.append(f"        Last {history_len} samples")
 
         # Control information
         if control_info:
             output.append("")
             output.append(control_info)
 
-        output.append("=" * sep_width)
+        output.append(sep_eq)
 
-        # Clear and print all at once
         if clear:
-            self.clear_screen()
-        print("\n".join(output), flush=True)
+            resize_count = self._resize_count
+            screen_lines = "\n".join(output).split("\n")
+            # Row positions are only known while the frame and the newline
+            # after it fit on screen without scrolling
+            fits_height = len(screen_lines) < self.term_height
+            previous = self._screen_lines
+            if previous is not None and fits_height and len(previous) == len(screen_lines):
+                # Same shape as the frame on screen: rewrite only the lines
+                # that changed, in place, as long as none of them wraps
+                parts = []
+                for row, (line, old) in enumerate(zip(screen_lines, previous), 1):
+                    if line != old:
+                        if self._display_width(line) > self.term_width:
+                            break
+                        parts.append(f"\033[{row};1H{line}\033[K")
+                else:
+                    parts.append(f"\033[{len(screen_lines) + 1};1H")
+                    self.write_frame("".join(parts).encode())
+                    # A resize during the write invalidates what's on screen
+                    self._screen_lines = screen_lines if self._resize_count == resize_count else None
+                    return max_temp
+
+            # ... and no line wraps
+            fits = fits_height and all(self._display_width(line) <= self.term_width for line in screen_lines)
+            output[0] = self.CLEAR_SCREEN + output[0]
+        else:
+            # Drawn below earlier output, so row positions are unknown
+            fits = False
+
+        # Clear and print all at once, in a single write; the empty last
+        # line gives the trailing newline without copying the frame again
+        output.append("")
+        self.write_frame("\n".join(output).encode())
+        self._screen_lines = screen_lines if fits and self._resize_count == resize_count else None
 
         return max_temp
 
@@ -837,6 +1458,11 @@ class FanController:
             if not self.set_pwm_manual_mode(pwm_path, enable_path):
                 if is_interactive:
                     print(f"Warning: Could not set {label} to manual mode")
+        self.open_pwm_fds()
+        # Sensors update about once a second; let the display reuse the
+        # readings the control step just took instead of re-reading them.
+        # Kept below the shortest (interval / 4) poll period.
+        self.sensor_ttl = interval * 0.2
 
         time.sleep(1)
 
@@ -845,46 +1471,96 @@ class FanController:
                 try:
                     first_iteration = True
                     iteration_count = 0
+                    # Poll less often while the temperature holds steady
+                    current_interval = interval
+                    previous_max_temp = None
+                    # PWM band we're holding, when it was entered and at what temperature
+                    band = None
+                    band_entered_at = band_temp = 0.0
+                    skip_hold = False  # Set when the offset was lowered
 
                     while True:
+                        # The wait is measured from the start of the tick, so
+                        # time spent reading and drawing doesn't add to it
+                        tick_start = time.monotonic()
+
                         # Get maximum temperature from control sensors (CPU cores + GPU)
-                        control_temps = self.get_control_temperatures()
+                        control_temps = self.get_control_temperatures(share_with_display=is_interactive)
                         if not control_temps:
-                            print("No control temperature readings available!")
+                            self.print_message("No control temperature readings available!")
                             time.sleep(interval)
                             continue
 
                         max_temp = max(control_temps.values())
 
+                        # Back off up to 4x the interval while stable, poll 4x
+                        # faster while the temperature moves quickly, and run
+                        # at the configured rate in between
+                        slew = abs(max_temp - previous_max_temp) if previous_max_temp is not None else None
+                        if slew is None:
+                            current_interval = interval
+                        elif slew < self.STABLE_TEMP_DELTA:
+                            current_interval = min(interval * 4, max(interval, current_interval) * 1.25)
+                        elif slew > self.FAST_TEMP_DELTA:
+                            current_interval = interval / 4
+                        else:
+                            current_interval = interval
+                        previous_max_temp = max_temp
+
                         # Calculate target PWM value with manual offset
                         base_pwm = self.calculate_pwm_from_temp(max_temp)
                         target_pwm = max(0, min(255, base_pwm + self.manual_pwm_offset))
 
                         # Implement asymmetric response (fast ramp-up, slow ramp-down)
-                        if self.current_pwm is None:
-                            # First iteration: set to target immediately
-                            pwm_value = target_pwm
-                        elif target_pwm > self.current_pwm:
-                            # Temperature rising: respond quickly (fast ramp-up)
+                        now = time.monotonic()
+                        target_band = target_pwm // self.PWM_BAND
+                        if self.current_pwm is None or target_pwm >= self.current_pwm:
+                            # First iteration or temperature rising:
+                            # go to target immediately (fast ramp-up)
                             pwm_value = target_pwm
+                            if target_band != band:
+                                band, band_entered_at, band_temp = target_band, now, max_temp
                         else:
-                            # Temperature falling: respond slowly (slow ramp-down)
-                            pwm_decrease = min(self.current_pwm - target_pwm, self.pwm_decrease_step)
-                            pwm_value = self.current_pwm - pwm_decrease
+                            # Temperature falling: only leave the current band once it
+                            # has been held long enough and the sensor has clearly cooled
+                            # (or right away after the offset was lowered)
+                            if target_band < band and (skip_hold or (
+                                    now - band_entered_at > self.BAND_HOLD_SECONDS
+                                    and max_temp < band_temp - self.BAND_DROP_MARGIN)):
+                                band, band_entered_at, band_temp = target_band, now, max_temp
+                            # Ramp down to the target once it is in the band we hold;
+                            # while it is below, ramp no further than into that band
+                            if target_band >= band:
+                                floor_pwm = target_pwm
+                            else:
+                                floor_pwm = min(self.current_pwm, (band + 1) * self.PWM_BAND - 1)
+                            if self.current_pwm > floor_pwm:
+                                # Respond slowly (slow ramp-down)
+                                pwm_decrease = min(self.current_pwm - floor_pwm, self.pwm_decrease_step)
+                                pwm_value = self.current_pwm - pwm_decrease
+                                ramp_state = "ramping down"
+                            else:
+                                pwm_value = self.current_pwm
+                                ramp_state = "holding"
+                        skip_hold = False
+
+                        # pwm_decrease_step applies per iteration, so don't stretch
+                        # the interval (and slow the ramp) while ramping down
+                        if self.current_pwm is not None and pwm_value < self.current_pwm:
+                            current_interval = min(current_interval, interval)
 
                         # Update current PWM tracker
                         self.current_pwm = pwm_value
 
                         # Set all PWM channels
-                        for pwm_path, enable_path, _, label in self.pwm_controls:
-                            self.set_pwm_value(pwm_path, pwm_value)
+                        self.set_all_pwm_values(pwm_value)
 
                         # Display status or log to console
                         if is_interactive:
                             # Interactive mode: fancy display
                             control_info = f"🎯 Control: Max temp = {max_temp:.1f}°C → Target PWM = {target_pwm}/255"
                             if pwm_value != target_pwm:
-                                control_info += f" → Actual PWM = {pwm_value}/255 ({pwm_value/255*100:.1f}%) [ramping down]"
+                                control_info += f" → Actual PWM = {pwm_value}/255 ({pwm_value/255*100:.1f}%) [{ramp_state}]"
                             else:
                                 control_info += f" → PWM = {pwm_value}/255 ({pwm_value/255*100:.1f}%)"
                             if self.manual_pwm_offset != 0:
@@ -893,7 +1569,8 @@ class FanController:
                             self.display_status(clear=not first_iteration, show_history=True, control_info=control_info)
                         else:
                             # Daemon mode: simple status output
-                            print(f"Fan control active: Max temp {max_temp:.1f}°C → PWM {pwm_value}/255 ({pwm_value/255*100:.1f}%)", flush=True)
+                            sys.stdout.write(f"Fan control active: Max temp {max_temp:.1f}°C → PWM {pwm_value}/255 ({pwm_value/255*100:.1f}%)\n")
+                            sys.stdout.flush()
 
                         first_iteration = False
                         iteration_count += 1
@@ -904,83 +1581,91 @@ class FanController:
 
                         # Sleep and handle keyboard input based on mode
                         if is_interactive:
-                            # Interactive mode: check for keyboard input during sleep
-                            sleep_start = time.time()
-                            while time.time() - sleep_start < interval:
-                                key = kb.get_key(timeout=0.05)
+                            # Interactive mode: block until a key arrives or the interval ends
+                            sleep_end = tick_start + current_interval
+                            while (remaining := sleep_end - time.monotonic()) > 0:
+                                key = kb.get_key(timeout=remaining)
                                 if key:
                                     if key in ('q', 'Q'):
                                         return  # Exit cleanly
-                                    elif key in ('w', 'W', 'UP'):
-                                        self.manual_pwm_offset = min(self.manual_pwm_offset + 10, 255)
-                                        break  # Force immediate update
-                                    elif key in ('s', 'S', 'DOWN'):
-                                        self.manual_pwm_offset = max(self.manual_pwm_offset - 10, -255)
+                                    step = self.OFFSET_KEYS.get(key)
+                                    if step:
+                                        self.manual_pwm_offset = max(-255, min(self.manual_pwm_offset + step, 255))
+                                        if step < 0:
+                                            # Leave the band on the next tick without
+                                            # holding; the drop still ramps down gradually
+                                            skip_hold = True
                                         break  # Force immediate update
                         else:
-                            # Daemon mode: just sleep for the full interval (no keyboard checking)
-                            time.sleep(interval)
+                            # Daemon mode: just sleep out the interval (no keyboard checking)
+                            time.sleep(max(0.0, tick_start + current_interval - time.monotonic()))
 
                 except KeyboardInterrupt:
                     print("\n\n⚠️  Interrupted by user...")
         finally:
             # Always restore BIOS control when exiting, even if there was an error
+            self.close_pwm_fds()
             self.restore_all_bios_control()
+            self.close()
 
 
-def get_config_path():
-    """Get the path to the config file, returns None if directory can't be created"""
-    try:
-        config_dir = Path.home() / '.config' / 'fan_control'
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / 'fan_control.conf'
-    except (OSError, PermissionError) as e:
-        # Can't create config directory, will use defaults only
-        return None
-
-
-def create_default_config():
-    """Create default config content"""
-    return """# Fan Control Configuration
+# Config file layout written by create_default_config() and save_config()
+_CONFIG_TEMPLATE = """# Fan Control Configuration
 # Lines starting with # are comments
 
 # Hardware monitor device path
-hwmon_path = /sys/class/hwmon/hwmon3
+hwmon_path = {hwmon_path}
 
 # Temperature range (Celsius)
-temp_min = 45.0
-temp_max = 80.0
+temp_min = {temp_min}
+temp_max = {temp_max}
 
 # PWM range (0-255)
-pwm_min = 10
-pwm_max = 255
+pwm_min = {pwm_min}
+pwm_max = {pwm_max}
 
 # PWM decrease step (0-255, lower = slower ramp-down)
 # Controls how fast fans slow down when temperature drops
 # Default: 5 (gradual decrease), set higher for faster response
-pwm_decrease_step = 5
+pwm_decrease_step = {pwm_decrease_step}
 
 # Update interval in seconds
-interval = 2.0
+interval = {interval}
 
 # History size (number of samples to keep)
 # Large enough to fill ultra-wide terminals
-history_size = 300
+history_size = {history_size}
 """
 
 
+def get_config_path():
+    """Get the path to the config file, returns None if directory can't be created"""
+    try:
+        config_dir = Path.home() / '.config' / 'fan_control'
+        config_dir.mkdir(parents=True, exist_ok=True)
+        return config_dir / 'fan_control.conf'
+    except (OSError, PermissionError) as e:
+        # Can't create config directory, will use defaults only
+        return None
+
+
+def create_default_config():
+    """Create default config content"""
+    return _CONFIG_TEMPLATE.format_map(_DEFAULT_CONFIG)
+
+
+# ((config path, mtime in ns), parsed config) from the last load_config() call
+_config_cache = None
+
+
 def load_config():
-    """Load configuration from file, falls back to defaults if config unavailable"""
-    default_config = {
-        'interval': 2.0,
-        'temp_min': 45.0,
-        'temp_max': 80.0,
-        'pwm_min': 10,
-        'pwm_max': 255,
-        'pwm_decrease_step': 5,
-        'history_size': 300,
-        'hwmon_path': '/sys/class/hwmon/hwmon3'
-    }
+    """Load configuration from file, falls back to defaults if config unavailable
+
+    The parsed file is cached until its modification time changes; every
+    call returns a fresh dict the caller may modify.
+    """
+    global _config_cache
+    default_config = dict(_DEFAULT_CONFIG)
 
     config_path = get_config_path()
 
@@ -988,7 +1673,14 @@ def load_config():
     if config_path is None:
         return default_config
 
-    if not config_path.exists():
+    try:
+        cache_key = (config_path, config_path.stat().st_mtime_ns)
+    except OSError:
+        cache_key = None
+    if cache_key is not None and _config_cache is not None and _config_cache[0] == cache_key:
+        return dict(_config_cache[1])
+
+    if cache_key is None:
         # Create default config file
         try:
             with open(config_path, 'w') as f:
@@ -1008,28 +1700,23 @@ def load_config():
                 if not line or line.startswith('#'):
                     continue
 
-                # Parse key = value
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Convert to appropriate type
-                    if key in ['temp_min', 'temp_max', 'interval']:
-                        default_config[key] = float(value)
-                    elif key in ['pwm_min', 'pwm_max', 'pwm_decrease_step', 'history_size']:
-                        default_config[key] = int(value)
-                    elif key == 'hwmon_path':
-                        default_config[key] = value
+                # Parse key = value and convert to the appropriate type
+                key, sep, value = line.partition('=')
+                key = key.strip()
+                parser = _CONFIG_PARSERS.get(key) if sep else None
+                if parser:
+                    default_config[key] = parser(value.strip())
     except Exception as e:
         # Silently fall back to defaults if we can't read the file
         pass
 
+    _config_cache = (cache_key, dict(default_config))
     return default_config
 
 
 def save_config(config):
     """Save configuration to file"""
+    global _config_cache
     config_path = get_config_path()
 
     if config_path is None:
@@ -1037,34 +1724,10 @@ def save_config(config):
         return False
 
     try:
-        content = f"""# Fan Control Configuration
-# Lines starting with # are comments
-
-# Hardware monitor device path
-hwmon_path = {config.get('hwmon_path', '/sys/class/hwmon/hwmon3')}
-
-# Temperature range (Celsius)
-temp_min = {config.get('temp_min', 45.0)}
-temp_max = {config.get('temp_max', 80.0)}
-
-# PWM range (0-255)
-pwm_min = {config.get('pwm_min', 10)}
-pwm_max = {config.get('pwm_max', 255)}
-
-# PWM decrease step (0-255, lower = slower ramp-down)
-# Controls how fast fans slow down when temperature drops
-# Default: 5 (gradual decrease), set higher for faster response
-pwm_decrease_step = {config.get('pwm_decrease_step', 5)}
-
-# Update interval in seconds
-interval = {config.get('interval', 2.0)}
-
-# History size (number of samples to keep)
-# Large enough to fill ultra-wide terminals
-history_size = {config.get('history_size', 300)}
-"""
+        content = _CONFIG_TEMPLATE.format_map({**_DEFAULT_CONFIG, **config})
         with open(config_path, 'w') as f:
             f.write(content)
+        _config_cache = None
         print(f"Configuration saved to {config_path}")
         return True
     except Exception as e:
@@ -1072,10 +1735,52 @@ history_size = {config.get('history_size', 300)}
         return False
 
 
-def main():
-    # Load config first
-    config = load_config()
+def watch_loop(controller: FanController, interval: float, max_iterations: Optional[int] = None):
+    """Redraw the status display every interval seconds until Q is pressed"""
+    if max_iterations:
+        print(f"Controls: [Q]uit to stop | Test mode: Running for {max_iterations} iterations\n")
+    else:
+        print("Controls: [Q]uit to stop\n")
+    sys.stdout.flush()
+
+    with KeyboardHandler() as kb:
+        try:
+            first_iteration = True
+            next_update = time.monotonic() + interval
+            iteration_count = 0
+
+            while True:
+                # Wait for keyboard input until the next display update is due
+                key = kb.get_key(timeout=max(0.0, next_update - time.monotonic()))
+                if key:
+                    if key in ('q', 'Q'):
+                        break
+
+                # Update display at intervals
+                current_time = time.monotonic()
+                if current_time >= next_update:
+                    control_info = "⌨️  Controls: [Q]uit"
+                    controller.display_status(clear=not first_iteration, show_history=True, control_info=control_info)
+                    first_iteration = False
+                    # Stay on the interval grid; if the update overran,
+                    # skip the missed ticks instead of bunching them up
+                    next_update += interval
+                    if next_update <= current_time:
+                        next_update += ((current_time - next_update) // interval + 1) * interval
+                    iteration_count += 1
+
+                    # Check if we've reached max iterations
+                    if max_iterations and iteration_count >= max_iterations:
+                        break
+
+        except KeyboardInterrupt:
+            pass
+
+    print("\n\nStopped monitoring.")
+
 
+def parse_args(config):
+    """Parse the command line; config values are shown as defaults in --help"""
     parser = argparse.ArgumentParser(description='Fan Control Monitor')
     parser.add_argument('command', nargs='?', choices=['set'], default=None,
                        help='Command: "set" to save current flags to config')
@@ -1108,7 +1813,14 @@ def main():
     parser.add_argument('--daemon', action='store_true',
                        help='Force daemon mode output (simple text, no fancy UI) - for testing')
 
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def main():
+    # Load config first
+    config = load_config()
+
+    args = parse_args(config)
 
     # Merge command line args with config (command line takes precedence)
     interval = args.interval if args.interval is not None else config['interval']
@@ -1144,7 +1856,8 @@ def main():
 
     # Test PWM responsiveness if requested
     if args.test_pwm or args.test_pwm_full:
-        controller.test_pwm_responsiveness(comprehensive=args.test_pwm_full)
+        with controller:
+            controller.test_pwm_responsiveness(comprehensive=args.test_pwm_full)
         return
 
     # Check if running as root
@@ -1168,46 +1881,12 @@ def main():
         # Root user with --auto flag: control fans
         controller.auto_control(interval=interval, max_iterations=args.iterations, force_daemon=args.daemon)
     elif args.watch:
-        if args.iterations:
-            print(f"Controls: [Q]uit to stop | Test mode: Running for {args.iterations} iterations\n")
-        else:
-            print("Controls: [Q]uit to stop\n")
-        time.sleep(0.5)
-
-        with KeyboardHandler() as kb:
-            try:
-                first_iteration = True
-                last_update = time.time()
-                iteration_count = 0
-
-                while True:
-                    current_time = time.time()
-
-                    # Check for keyboard input
-                    key = kb.get_key(timeout=0.05)
-                    if key:
-                        if key in ('q', 'Q'):
-                            break
-
-                    # Update display at intervals
-                    if current_time - last_update >= interval:
-                        control_info = "⌨️  Controls: [Q]uit"
-                        controller.display_status(clear=not first_iteration, show_history=True, control_info=control_info)
-                        first_iteration = False
-                        last_update = current_time
-                        iteration_count += 1
-
-                        # Check if we've reached max iterations
-                        if args.iterations and iteration_count >= args.iterations:
-                            break
-
-            except KeyboardInterrupt:
-                pass
-
-        print("\n\nStopped monitoring.")
+        watch_loop(controller, interval, args.iterations)
     else:
         controller.display_status()
 
+    controller.close()
+
 
 if __name__ == "__main__":
     main()